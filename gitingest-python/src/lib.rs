@@ -0,0 +1,506 @@
+// The pyo3 0.20 macros expand to non-local impl blocks; drop this together
+// with the edition pin in Cargo.toml when migrating to pyo3 >=0.22.
+#![allow(non_local_definitions)]
+
+use futures::StreamExt;
+use gitingest::{AppConfig, DownloadFormat, IngestRequest, IngestResponse, IngestService, PatternService, StreamItem};
+use pyo3::exceptions::{PyRuntimeError, PyStopAsyncIteration, PyValueError};
+use pyo3::prelude::*;
+use pyo3::types::{PyBytes, PyDict, PyList};
+use std::sync::Arc;
+use tokio::sync::{Mutex, mpsc};
+
+fn to_py_err(err: gitingest::GitingestError) -> PyErr {
+    PyRuntimeError::new_err(err.to_string())
+}
+
+fn response_to_py(py: Python<'_>, response: IngestResponse) -> PyResult<PyObject> {
+    let dict = PyDict::new(py);
+    dict.set_item("id", response.id.to_string())?;
+    dict.set_item("repo_url", response.repo_url)?;
+    dict.set_item("short_repo_url", response.short_repo_url)?;
+    dict.set_item("summary", response.summary)?;
+    dict.set_item("tree", response.tree)?;
+    // Bytes, not str: a PyBytes is a plain memcpy, while building a PyString
+    // would UTF-8 validate and convert the (often multi-MB) content again.
+    dict.set_item("content", PyBytes::new(py, response.content.as_bytes()))?;
+    dict.set_item("status", "completed")?;
+    Ok(dict.into())
+}
+
+/// Drive a batch of ingest requests with bounded concurrency, returning
+/// results in input order.
+async fn process_batch(
+    config: AppConfig,
+    urls: Vec<String>,
+    max_concurrency: usize,
+    options: IngestOptions,
+) -> Vec<(String, gitingest::Result<IngestResponse>)> {
+    let mut results: Vec<_> = futures::stream::iter(urls.into_iter().enumerate().map(
+        |(index, url)| {
+            let config = config.clone();
+            let request = options.to_request(url.clone(), None);
+            async move {
+                let result = IngestService::process_repository(request, &config).await;
+                (index, url, result)
+            }
+        },
+    ))
+    .buffer_unordered(max_concurrency.max(1))
+    .collect()
+    .await;
+    results.sort_by_key(|(index, _, _)| *index);
+    results
+        .into_iter()
+        .map(|(_, url, result)| (url, result))
+        .collect()
+}
+
+fn batch_to_py(
+    py: Python<'_>,
+    results: Vec<(String, gitingest::Result<IngestResponse>)>,
+) -> PyResult<PyObject> {
+    let list = PyList::empty(py);
+    for (url, result) in results {
+        match result {
+            Ok(response) => list.append(response_to_py(py, response)?)?,
+            Err(err) => list.append(failure_to_py(py, &url, err)?)?,
+        }
+    }
+    Ok(list.into())
+}
+
+fn failure_to_py(py: Python<'_>, url: &str, err: gitingest::GitingestError) -> PyResult<PyObject> {
+    let dict = PyDict::new(py);
+    dict.set_item("repo_url", url)?;
+    dict.set_item("status", "failed")?;
+    dict.set_item("error", err.to_string())?;
+    Ok(dict.into())
+}
+
+/// Include/exclude patterns, either a raw comma-separated string or a list.
+///
+/// Raw strings are preferred: they cross the FFI boundary as a single
+/// object and are split (and their glob sets compiled and cached) on the
+/// Rust side.
+#[derive(FromPyObject)]
+enum Patterns {
+    #[pyo3(transparent, annotation = "str")]
+    Raw(String),
+    #[pyo3(transparent, annotation = "list[str]")]
+    List(Vec<String>),
+}
+
+impl Patterns {
+    fn into_vec(self) -> Vec<String> {
+        match self {
+            Patterns::Raw(raw) => PatternService::split_patterns(&raw),
+            Patterns::List(list) => list,
+        }
+    }
+}
+
+/// Per-request ingest options.
+///
+/// One options object crosses the FFI boundary instead of seven separate
+/// kwargs, so every entry point shares a single argument-binding and
+/// request-building path.  Pattern fields accept either a comma-separated
+/// string or a list of strings and are normalized to lists on assignment.
+#[pyclass]
+#[derive(Clone, Default)]
+pub struct IngestOptions {
+    #[pyo3(get, set)]
+    max_file_size: Option<u64>,
+    #[pyo3(get, set)]
+    max_files: Option<usize>,
+    #[pyo3(get, set)]
+    branch: Option<String>,
+    #[pyo3(get, set)]
+    token: Option<String>,
+    #[pyo3(get, set)]
+    include_submodules: bool,
+    include_patterns: Option<Vec<String>>,
+    exclude_patterns: Option<Vec<String>>,
+}
+
+#[pymethods]
+impl IngestOptions {
+    #[new]
+    #[pyo3(signature = (
+        *,
+        include_patterns = None,
+        exclude_patterns = None,
+        max_file_size = None,
+        max_files = None,
+        branch = None,
+        token = None,
+        include_submodules = false,
+    ))]
+    #[allow(clippy::too_many_arguments)]
+    fn new(
+        include_patterns: Option<Patterns>,
+        exclude_patterns: Option<Patterns>,
+        max_file_size: Option<u64>,
+        max_files: Option<usize>,
+        branch: Option<String>,
+        token: Option<String>,
+        include_submodules: bool,
+    ) -> Self {
+        Self {
+            max_file_size,
+            max_files,
+            branch,
+            token,
+            include_submodules,
+            include_patterns: include_patterns.map(Patterns::into_vec),
+            exclude_patterns: exclude_patterns.map(Patterns::into_vec),
+        }
+    }
+
+    #[getter]
+    fn include_patterns(&self) -> Option<Vec<String>> {
+        self.include_patterns.clone()
+    }
+
+    #[setter]
+    fn set_include_patterns(&mut self, value: Option<Patterns>) {
+        self.include_patterns = value.map(Patterns::into_vec);
+    }
+
+    #[getter]
+    fn exclude_patterns(&self) -> Option<Vec<String>> {
+        self.exclude_patterns.clone()
+    }
+
+    #[setter]
+    fn set_exclude_patterns(&mut self, value: Option<Patterns>) {
+        self.exclude_patterns = value.map(Patterns::into_vec);
+    }
+}
+
+impl IngestOptions {
+    /// Build the core `IngestRequest` for `url` from these options.
+    fn to_request(&self, url: String, download_format: Option<DownloadFormat>) -> IngestRequest {
+        IngestRequest {
+            input_text: url,
+            max_file_size: self.max_file_size,
+            max_files: self.max_files,
+            pattern_type: None,
+            pattern: None,
+            include_patterns: self.include_patterns.clone(),
+            exclude_patterns: self.exclude_patterns.clone(),
+            token: self.token.clone(),
+            branch: self.branch.clone(),
+            include_submodules: Some(self.include_submodules),
+            download_format,
+        }
+    }
+}
+
+/// Ingestion configuration, mirroring the Rust `AppConfig`.
+#[pyclass]
+#[derive(Clone)]
+pub struct GitingestConfig {
+    inner: AppConfig,
+}
+
+#[pymethods]
+impl GitingestConfig {
+    #[new]
+    fn new() -> Self {
+        Self {
+            inner: AppConfig::default(),
+        }
+    }
+
+    /// Build a configuration from environment variables.
+    #[staticmethod]
+    fn from_env() -> PyResult<Self> {
+        AppConfig::from_env()
+            .map(|inner| Self { inner })
+            .map_err(|e| PyValueError::new_err(e.to_string()))
+    }
+
+    #[getter]
+    fn max_file_size(&self) -> u64 {
+        self.inner.max_file_size
+    }
+
+    #[getter]
+    fn max_files(&self) -> usize {
+        self.inner.max_files
+    }
+
+    #[getter]
+    fn max_total_size(&self) -> u64 {
+        self.inner.max_total_size
+    }
+
+    #[getter]
+    fn max_directory_depth(&self) -> u32 {
+        self.inner.max_directory_depth
+    }
+
+    #[getter]
+    fn default_timeout(&self) -> u64 {
+        self.inner.default_timeout
+    }
+
+    #[getter]
+    fn temp_dir(&self) -> String {
+        self.inner.temp_dir.clone()
+    }
+
+    #[getter]
+    fn github_token(&self) -> Option<String> {
+        self.inner.github_token.clone()
+    }
+
+    #[getter]
+    fn allowed_hosts(&self) -> Vec<String> {
+        self.inner.allowed_hosts.clone()
+    }
+
+    #[getter]
+    fn concurrent_file_limit(&self) -> usize {
+        self.inner.concurrent_file_limit
+    }
+
+    #[getter]
+    fn batch_size(&self) -> usize {
+        self.inner.batch_size
+    }
+}
+
+/// Async iterator over `(label, bytes)` items of a streaming ingest.
+///
+/// The first items are `("repository", ...)`, `("summary", ...)` and
+/// `("tree", ...)`; the rest are `(relative_path, formatted content block)`
+/// in tree order.
+#[pyclass]
+pub struct IngestStream {
+    rx: Arc<Mutex<mpsc::Receiver<PyResult<(String, Vec<u8>)>>>>,
+}
+
+#[pymethods]
+impl IngestStream {
+    fn __aiter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __anext__<'py>(&self, py: Python<'py>) -> PyResult<Option<&'py PyAny>> {
+        let rx = self.rx.clone();
+        let future = pyo3_asyncio::tokio::future_into_py(py, async move {
+            match rx.lock().await.recv().await {
+                Some(item) => {
+                    let (label, bytes) = item?;
+                    Python::with_gil(|py| -> PyResult<PyObject> {
+                        Ok((label, PyBytes::new(py, &bytes)).into_py(py))
+                    })
+                }
+                None => Err(PyStopAsyncIteration::new_err(())),
+            }
+        })?;
+        Ok(Some(future))
+    }
+}
+
+/// Entry point for repository ingestion from Python.
+#[pyclass]
+pub struct Gitingest {
+    config: AppConfig,
+}
+
+#[pymethods]
+impl Gitingest {
+    #[new]
+    #[pyo3(signature = (config = None))]
+    fn new(config: Option<GitingestConfig>) -> PyResult<Self> {
+        let config = match config {
+            Some(config) => config.inner,
+            None => AppConfig::from_env().map_err(|e| PyValueError::new_err(e.to_string()))?,
+        };
+        Ok(Self { config })
+    }
+
+    /// Ingest a repository; returns an awaitable resolving to a result dict.
+    #[pyo3(signature = (url, options = None))]
+    fn ingest<'py>(
+        &self,
+        py: Python<'py>,
+        url: String,
+        options: Option<IngestOptions>,
+    ) -> PyResult<&'py PyAny> {
+        let config = self.config.clone();
+        let request = options.unwrap_or_default().to_request(url, None);
+        pyo3_asyncio::tokio::future_into_py(py, async move {
+            let response = IngestService::process_repository(request, &config)
+                .await
+                .map_err(to_py_err)?;
+            Python::with_gil(|py| response_to_py(py, response))
+        })
+    }
+
+    /// Ingest several repositories concurrently inside the Rust core.
+    ///
+    /// Returns an awaitable resolving to one result dict per URL, in input
+    /// order. Repositories that fail are reported as
+    /// ``{"repo_url": ..., "status": "failed", "error": ...}`` entries
+    /// instead of aborting the whole batch.
+    #[pyo3(signature = (urls, options = None, *, max_concurrency = 8))]
+    fn ingest_many<'py>(
+        &self,
+        py: Python<'py>,
+        urls: Vec<String>,
+        options: Option<IngestOptions>,
+        max_concurrency: usize,
+    ) -> PyResult<&'py PyAny> {
+        let config = self.config.clone();
+        let options = options.unwrap_or_default();
+        pyo3_asyncio::tokio::future_into_py(py, async move {
+            let results = process_batch(config, urls, max_concurrency, options).await;
+            Python::with_gil(|py| batch_to_py(py, results))
+        })
+    }
+
+    /// Stream an ingest as an async iterator instead of one result dict.
+    ///
+    /// Items arrive as soon as each file block is formatted, so the full
+    /// content never needs to exist in memory; `buffer` bounds how many
+    /// blocks may be in flight.
+    #[pyo3(signature = (url, options = None, *, buffer = 16))]
+    fn ingest_stream(
+        &self,
+        url: String,
+        options: Option<IngestOptions>,
+        buffer: usize,
+    ) -> PyResult<IngestStream> {
+        let config = self.config.clone();
+        let request = options.unwrap_or_default().to_request(url, None);
+
+        let capacity = buffer.max(1);
+        let (item_tx, item_rx) = mpsc::channel::<PyResult<(String, Vec<u8>)>>(capacity);
+        pyo3_asyncio::tokio::get_runtime().spawn(async move {
+            let (core_tx, mut core_rx) = mpsc::channel::<StreamItem>(capacity);
+            let producer = pyo3_asyncio::tokio::get_runtime().spawn(async move {
+                IngestService::stream_repository(request, &config, core_tx).await
+            });
+
+            while let Some(item) = core_rx.recv().await {
+                let tuple = match item {
+                    StreamItem::Repository(short_url) => ("repository".to_string(), short_url.into_bytes()),
+                    StreamItem::Summary(summary) => ("summary".to_string(), summary.into_bytes()),
+                    StreamItem::Tree(tree) => ("tree".to_string(), tree.into_bytes()),
+                    StreamItem::FileContent { path, content } => (path, content),
+                };
+                if item_tx.send(Ok(tuple)).await.is_err() {
+                    return;
+                }
+            }
+
+            match producer.await {
+                Ok(Ok(())) => {}
+                Ok(Err(err)) => {
+                    let _ = item_tx.send(Err(to_py_err(err))).await;
+                }
+                Err(err) => {
+                    let _ = item_tx.send(Err(PyRuntimeError::new_err(err.to_string()))).await;
+                }
+            }
+        });
+
+        Ok(IngestStream {
+            rx: Arc::new(Mutex::new(item_rx)),
+        })
+    }
+
+    /// Ingest a repository and write the formatted output directly to a file.
+    ///
+    /// The whole pipeline — formatting included — runs in Rust, so the
+    /// content never crosses the FFI boundary or exists as a Python object.
+    /// `format` is one of ``"text"``, ``"markdown"`` or ``"json"``.  Returns
+    /// an awaitable resolving to ``None``.
+    #[pyo3(signature = (url, output_path, options = None, *, format = String::from("text")))]
+    fn ingest_to_file<'py>(
+        &self,
+        py: Python<'py>,
+        url: String,
+        output_path: String,
+        options: Option<IngestOptions>,
+        format: String,
+    ) -> PyResult<&'py PyAny> {
+        let download_format = match format.as_str() {
+            "text" | "txt" => DownloadFormat::Text,
+            "markdown" | "md" => DownloadFormat::Markdown,
+            "json" => DownloadFormat::Json,
+            other => {
+                return Err(PyValueError::new_err(format!(
+                    "unknown format: {other:?} (expected 'text', 'markdown' or 'json')"
+                )));
+            }
+        };
+        let config = self.config.clone();
+        let request = options
+            .unwrap_or_default()
+            .to_request(url, Some(download_format));
+        pyo3_asyncio::tokio::future_into_py(py, async move {
+            IngestService::process_repository_to_file(
+                request,
+                &config,
+                std::path::Path::new(&output_path),
+            )
+            .await
+            .map_err(to_py_err)
+        })
+    }
+
+    /// Blocking version of `ingest`.
+    ///
+    /// The GIL is released while the Rust pipeline runs, so Python threads
+    /// (e.g. a ThreadPoolExecutor ingesting many repositories) proceed in
+    /// parallel.
+    #[pyo3(signature = (url, options = None))]
+    fn ingest_sync(
+        &self,
+        py: Python<'_>,
+        url: String,
+        options: Option<IngestOptions>,
+    ) -> PyResult<PyObject> {
+        let config = self.config.clone();
+        let request = options.unwrap_or_default().to_request(url, None);
+        let response = py
+            .allow_threads(|| {
+                pyo3_asyncio::tokio::get_runtime()
+                    .block_on(IngestService::process_repository(request, &config))
+            })
+            .map_err(to_py_err)?;
+        response_to_py(py, response)
+    }
+
+    /// Blocking version of `ingest_many`; releases the GIL like `ingest_sync`.
+    #[pyo3(signature = (urls, options = None, *, max_concurrency = 8))]
+    fn ingest_many_sync(
+        &self,
+        py: Python<'_>,
+        urls: Vec<String>,
+        options: Option<IngestOptions>,
+        max_concurrency: usize,
+    ) -> PyResult<PyObject> {
+        let config = self.config.clone();
+        let options = options.unwrap_or_default();
+        let results = py.allow_threads(|| {
+            pyo3_asyncio::tokio::get_runtime()
+                .block_on(process_batch(config, urls, max_concurrency, options))
+        });
+        batch_to_py(py, results)
+    }
+}
+
+#[pymodule]
+fn gitingest_python(_py: Python<'_>, m: &PyModule) -> PyResult<()> {
+    m.add_class::<Gitingest>()?;
+    m.add_class::<GitingestConfig>()?;
+    m.add_class::<IngestOptions>()?;
+    m.add_class::<IngestStream>()?;
+    Ok(())
+}
@@ -152,6 +152,18 @@ impl Default for FileSystemStats {
     }
 }
 
+/// One item of a streaming ingest, in emission order: the repository
+/// identifier and summary metadata first, then one content block per file.
+#[derive(Debug)]
+pub enum StreamItem {
+    /// Short `owner/name` identifier, sent first.
+    Repository(String),
+    Summary(String),
+    Tree(String),
+    /// A file's formatted content block, in tree order.
+    FileContent { path: String, content: Vec<u8> },
+}
+
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct ProcessingResult {
     pub summary: String,
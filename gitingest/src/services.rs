@@ -1,30 +1,41 @@
 use crate::config::AppConfig;
 use crate::error::{GitingestError, Result};
-use crate::models::{CloneConfig, IngestRequest, IngestResponse, IngestStatus, PatternMatcher, ProcessingResult, ProcessingStats};
+use crate::models::{CloneConfig, DownloadFormat, FileNode, IngestRequest, IngestResponse, IngestStatus, PatternMatcher, ProcessingResult, ProcessingStats, StreamItem};
+use crate::models::ContentWriter;
 use crate::utils::{FileService, GitService, PatternService, UrlParser, format_file_size};
+use std::path::PathBuf;
 use std::time::Instant;
 use tempfile::TempDir;
+use tokio::sync::mpsc;
 use uuid::Uuid;
 
+/// A cloned and scanned repository, ready for output generation.
+///
+/// The temp dir owns the checkout; it is cleaned up on drop.
+struct PreparedIngest {
+    repository: crate::models::Repository,
+    #[allow(dead_code)]
+    temp_dir: TempDir,
+    local_path: PathBuf,
+    file_tree: FileNode,
+}
+
 pub struct IngestService;
 
 impl IngestService {
-    pub async fn process_repository(
+    async fn prepare_repository(
         request: IngestRequest,
         config: &AppConfig,
-    ) -> Result<IngestResponse> {
-        let start_time = Instant::now();
-        let id = Uuid::new_v4();
-        
+    ) -> Result<PreparedIngest> {
         // Parse the repository URL
         let repository = UrlParser::parse_git_url(&request.input_text)?;
-        
+
         // Create temporary directory for cloning
         let temp_dir = TempDir::new()
             .map_err(|e| GitingestError::FileSystemError(format!("Failed to create temp dir: {}", e)))?;
-        
+
         let local_path = temp_dir.path().join(&repository.name);
-        
+
         // Create clone configuration
         let clone_config = CloneConfig {
             url: repository.url.clone(),
@@ -35,16 +46,16 @@ impl IngestService {
             include_submodules: request.include_submodules.unwrap_or(false),
             token: request.token,
         };
-        
+
         // Clone the repository
         let clone_start = Instant::now();
         GitService::clone_repository(&clone_config).await?;
         let clone_duration = clone_start.elapsed();
         log::info!("Repository cloning phase completed in {:.2}s", clone_duration.as_secs_f64());
-        
+
         // Create pattern matcher
         let mut matcher = PatternMatcher::default();
-        
+
         // Add user-specified patterns
         if let Some(pattern) = request.pattern {
             match request.pattern_type {
@@ -56,24 +67,24 @@ impl IngestService {
                 }
             }
         }
-        
+
         // Add include patterns from CLI
         if let Some(patterns) = request.include_patterns {
             matcher.include_patterns.extend(patterns);
         }
-        
-        // Add exclude patterns from CLI  
+
+        // Add exclude patterns from CLI
         if let Some(patterns) = request.exclude_patterns {
             matcher.exclude_patterns.extend(patterns);
         }
-        
+
         // Add gitignore patterns
         let gitignore_path = local_path.join(".gitignore");
         PatternService::add_gitignore_patterns(&mut matcher, &gitignore_path)?;
-        
+
         // Set limits from config and request
         let max_file_size = request.max_file_size.unwrap_or(config.max_file_size);
-        
+
         // Scan the repository with memory-efficient loading
         log::info!("Starting memory-efficient file scanning...");
         let scan_start = Instant::now();
@@ -88,7 +99,25 @@ impl IngestService {
         ).await?;
         let scan_duration = scan_start.elapsed();
         log::info!("File scanning completed in {:.2}s", scan_duration.as_secs_f64());
-        
+
+        Ok(PreparedIngest {
+            repository,
+            temp_dir,
+            local_path,
+            file_tree,
+        })
+    }
+
+    pub async fn process_repository(
+        request: IngestRequest,
+        config: &AppConfig,
+    ) -> Result<IngestResponse> {
+        let start_time = Instant::now();
+        let id = Uuid::new_v4();
+
+        let PreparedIngest { repository, temp_dir: _temp_dir, local_path, file_tree } =
+            Self::prepare_repository(request, config).await?;
+
         // Generate tree string (lightweight)
         log::info!("Starting tree generation...");
         let generation_start = Instant::now();
@@ -146,17 +175,134 @@ impl IngestService {
         
         let total_processing_time = start_time.elapsed();
         log::info!(
-            "Repository ingestion completed successfully - Total time: {:.2}s (Clone: {:.2}s, Scan: {:.2}s, Tree: {:.2}s, Content: {:.2}s)", 
+            "Repository ingestion completed successfully - Total time: {:.2}s (Tree: {:.2}s, Content: {:.2}s)",
             total_processing_time.as_secs_f64(),
-            clone_duration.as_secs_f64(),
-            scan_duration.as_secs_f64(),
             generation_duration.as_secs_f64(),
             content_duration.as_secs_f64()
         );
-        
+
         Ok(response)
     }
-    
+
+    /// Ingest a repository and write the formatted output straight to
+    /// `output_path`, without handing the content back to the caller.
+    ///
+    /// Text and markdown are written through a 1 MiB `BufWriter` as the
+    /// content blocks are produced, so the full content string is never
+    /// materialized; JSON (which needs the complete response) is serialized
+    /// directly into the writer.  The format comes from
+    /// `request.download_format`, defaulting to text.
+    pub async fn process_repository_to_file(
+        request: IngestRequest,
+        config: &AppConfig,
+        output_path: &std::path::Path,
+    ) -> Result<()> {
+        use std::io::Write;
+
+        let format = request.download_format.clone().unwrap_or(DownloadFormat::Text);
+
+        if let DownloadFormat::Json = format {
+            let response = Self::process_repository(request, config).await?;
+            let file = std::fs::File::create(output_path)?;
+            let mut writer = std::io::BufWriter::new(file);
+            serde_json::to_writer_pretty(&mut writer, &response)?;
+            writer.flush()?;
+            return Ok(());
+        }
+
+        let prepared = Self::prepare_repository(request, config).await?;
+
+        let files_analyzed = Self::count_files(&prepared.file_tree);
+        let total_size_bytes = Self::calculate_total_size(&prepared.file_tree);
+        let summary = Self::generate_summary(&prepared.repository, files_analyzed, total_size_bytes);
+        let tree = FileService::generate_tree_string(&prepared.file_tree, "", true);
+        let short_url = Self::create_short_url(&prepared.repository);
+
+        let file = std::fs::File::create(output_path)?;
+        let mut writer = std::io::BufWriter::with_capacity(1024 * 1024, file);
+
+        match format {
+            DownloadFormat::Markdown => {
+                write!(
+                    writer,
+                    "# Repository: {}\n\n## Summary\n{}\n\n## Directory Structure\n```\n{}\n```\n\n## File Contents\n",
+                    short_url, summary, tree
+                )?;
+            }
+            _ => {
+                write!(
+                    writer,
+                    "Repository: {}\nSummary:\n{}\n\nDirectory Structure:\n{}\n\nFile Contents:\n",
+                    short_url, summary, tree
+                )?;
+            }
+        }
+
+        prepared
+            .file_tree
+            .write_content(&mut writer)
+            .map_err(|e| GitingestError::FileSystemError(e.to_string()))?;
+        writer.flush()?;
+
+        Ok(())
+    }
+
+    /// Stream a repository ingest through `tx` instead of materializing the
+    /// full content in memory.
+    ///
+    /// Emission order: `Repository` (short `owner/name`), `Summary`, `Tree`,
+    /// then one `FileContent` block per included file in tree order.  A
+    /// dropped receiver simply stops the stream.
+    pub async fn stream_repository(
+        request: IngestRequest,
+        config: &AppConfig,
+        tx: mpsc::Sender<StreamItem>,
+    ) -> Result<()> {
+        let start_time = Instant::now();
+
+        let prepared = Self::prepare_repository(request, config).await?;
+
+        let files_analyzed = Self::count_files(&prepared.file_tree);
+        let total_size_bytes = Self::calculate_total_size(&prepared.file_tree);
+        let summary = Self::generate_summary(&prepared.repository, files_analyzed, total_size_bytes);
+        let tree = FileService::generate_tree_string(&prepared.file_tree, "", true);
+
+        if tx.send(StreamItem::Repository(Self::create_short_url(&prepared.repository))).await.is_err() {
+            return Ok(());
+        }
+        if tx.send(StreamItem::Summary(summary)).await.is_err() {
+            return Ok(());
+        }
+        if tx.send(StreamItem::Tree(tree)).await.is_err() {
+            return Ok(());
+        }
+
+        let mut content_files = Vec::new();
+        FileService::collect_content_files(&prepared.file_tree, &mut content_files);
+
+        for file_node in content_files {
+            let mut block = Vec::new();
+            file_node
+                .write_content(&mut block)
+                .map_err(|e| GitingestError::FileSystemError(e.to_string()))?;
+            let item = StreamItem::FileContent {
+                path: file_node.relative_path.clone(),
+                content: block,
+            };
+            if tx.send(item).await.is_err() {
+                return Ok(());
+            }
+        }
+
+        log::info!(
+            "Repository streaming completed in {:.2}s ({} files)",
+            start_time.elapsed().as_secs_f64(),
+            files_analyzed
+        );
+
+        Ok(())
+    }
+
     fn generate_summary(repository: &crate::models::Repository, files_count: usize, total_size: u64) -> String {
         format!(
             "Repository: {}/{}\nFiles processed: {}\nTotal size: {}\nHost: {}",
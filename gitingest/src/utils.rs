@@ -2,6 +2,8 @@ pub mod git;
 pub mod patterns;
 pub mod files;
 pub mod url_parser;
+#[cfg(all(target_os = "linux", feature = "io-uring"))]
+pub mod uring;
 
 pub use git::*;
 pub use patterns::*;
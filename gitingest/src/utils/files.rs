@@ -9,8 +9,9 @@ use std::path::{Path, PathBuf};
 use std::sync::Arc;
 use std::{fs as std_fs};
 use tokio::fs;
+use ignore::WalkBuilder;
+use ignore::overrides::OverrideBuilder;
 use tokio::sync::Semaphore;
-use walkdir::WalkDir;
 
 pub struct FileService;
 
@@ -76,20 +77,34 @@ impl FileService {
         let path = path.as_ref();
         
         let discovery_start = std::time::Instant::now();
-        let all_paths: Vec<PathBuf> = WalkDir::new(path)
-            .max_depth(max_depth as usize)
-            .into_iter()
+
+        // Feed exclude and gitignore patterns into the walker as negated
+        // overrides so excluded subtrees (node_modules/, target/, ...) are
+        // pruned before they are ever read, instead of being enumerated and
+        // filtered afterwards.
+        let mut override_builder = OverrideBuilder::new(path);
+        for pattern in matcher.exclude_patterns.iter().chain(matcher.gitignore_patterns.iter()) {
+            override_builder
+                .add(&format!("!{}", pattern))
+                .map_err(|e| GitingestError::PatternError(format!("Invalid exclude pattern '{}': {}", pattern, e)))?;
+        }
+        let overrides = override_builder
+            .build()
+            .map_err(|e| GitingestError::PatternError(format!("Failed to build exclude overrides: {}", e)))?;
+
+        let all_paths: Vec<PathBuf> = WalkBuilder::new(path)
+            .max_depth(Some(max_depth as usize))
+            // Root .gitignore patterns were already collected into the
+            // matcher; skip the walker's own per-directory lookups.
+            .standard_filters(false)
+            .overrides(overrides)
+            .build()
             .filter_map(|entry| {
                 let entry = entry.ok()?;
                 let entry_path = entry.path();
-                
-                // For directories, check if we should include them for traversal
+
                 if entry_path.is_dir() {
-                    if PatternService::should_include_directory(matcher, entry_path).unwrap_or(true) {
-                        Some(entry_path.to_path_buf())
-                    } else {
-                        None
-                    }
+                    Some(entry_path.to_path_buf())
                 } else {
                     // For files, check if they match include patterns
                     if PatternService::should_include_file(matcher, entry_path).unwrap_or(false) {
@@ -273,10 +288,76 @@ impl FileService {
 
     pub fn write_content_to_file<P: AsRef<Path>>(node: &FileNode, output_path: P) -> Result<()> {
         let mut file = std::fs::File::create(output_path)?;
+        #[cfg(all(target_os = "linux", feature = "io-uring"))]
+        if crate::utils::uring::is_supported() {
+            return Self::write_content_uring(node, &mut file);
+        }
         node.write_content(&mut file).map_err(|e| GitingestError::FileSystemError(e.to_string()))?;
         Ok(())
     }
 
+    /// Same output as `ContentWriter::write_content`, but with file contents
+    /// fetched through batched io_uring reads instead of one blocking read
+    /// per file.
+    #[cfg(all(target_os = "linux", feature = "io-uring"))]
+    fn write_content_uring(node: &FileNode, writer: &mut std::fs::File) -> Result<()> {
+        use std::io::Write;
+
+        let mut content_files = Vec::new();
+        Self::collect_content_files(node, &mut content_files);
+
+        // Read and write one batch at a time: each batch's contents are
+        // dropped before the next submission, so peak memory is bounded by
+        // one batch of files rather than the whole repository, matching the
+        // streaming behavior of the blocking path this replaces.
+        for batch in content_files.chunks(crate::utils::uring::BATCH_SIZE) {
+            let readable: Vec<&Path> = batch
+                .iter()
+                .filter(|file_node| file_node.size <= 100_000)
+                .map(|file_node| file_node.path.as_path())
+                .collect();
+            let contents = crate::utils::uring::read_files(&readable)
+                .map_err(|e| GitingestError::FileSystemError(e.to_string()))?;
+            let mut content_iter = contents.into_iter();
+
+            for file_node in batch {
+                writeln!(writer, "{}:", file_node.relative_path)?;
+                writeln!(writer, "{}", "=".repeat(48))?;
+
+                if file_node.size > 100_000 {
+                    writeln!(writer, "[Large file content truncated - {} bytes]\n", file_node.size)?;
+                } else {
+                    match content_iter.next().unwrap_or(Ok(Vec::new())) {
+                        Ok(bytes) => match String::from_utf8(bytes) {
+                            Ok(content) => write!(writer, "{}\n\n", content)?,
+                            Err(_) => writeln!(writer, "[Error reading file content]\n")?,
+                        },
+                        Err(_) => writeln!(writer, "[Error reading file content]\n")?,
+                    }
+                }
+            }
+        }
+        Ok(())
+    }
+
+    /// Collect the file nodes whose content belongs in the output, in the
+    /// same depth-first order `ContentWriter::write_content` emits them.
+    pub fn collect_content_files<'a>(node: &'a FileNode, out: &mut Vec<&'a FileNode>) {
+        match node.node_type {
+            FileNodeType::File => {
+                if node.has_content {
+                    out.push(node);
+                }
+            }
+            FileNodeType::Directory => {
+                for child in &node.children {
+                    Self::collect_content_files(child, out);
+                }
+            }
+            FileNodeType::Symlink => {}
+        }
+    }
+
     pub fn generate_tree_string(node: &FileNode, prefix: &str, is_last: bool) -> String {
         let mut result = String::new();
         
@@ -334,6 +415,31 @@ mod tests {
         assert_eq!(format_file_size(1048576), "1.0 MB");
     }
 
+    #[tokio::test]
+    async fn test_scan_prunes_excluded_directories() {
+        let temp_dir = TempDir::new().unwrap();
+        std::fs::create_dir(temp_dir.path().join("node_modules")).unwrap();
+        std::fs::write(temp_dir.path().join("node_modules").join("dep.js"), "x").unwrap();
+        std::fs::write(temp_dir.path().join("main.rs"), "fn main() {}").unwrap();
+
+        let matcher = PatternMatcher::default();
+        let tree = FileService::scan_directory(
+            temp_dir.path(),
+            &matcher,
+            u64::MAX,
+            usize::MAX,
+            10,
+            4,
+            16,
+        )
+        .await
+        .unwrap();
+
+        let names: Vec<_> = tree.children.iter().map(|child| child.name.as_str()).collect();
+        assert!(names.contains(&"main.rs"));
+        assert!(!names.contains(&"node_modules"));
+    }
+
     #[test]
     fn test_file_reading() -> Result<()> {
         let temp_dir = TempDir::new().unwrap();
@@ -1,7 +1,23 @@
 use crate::error::{GitingestError, Result};
 use crate::models::PatternMatcher;
 use globset::{Glob, GlobSet, GlobSetBuilder};
+use lru::LruCache;
+use std::num::NonZeroUsize;
 use std::path::Path;
+use std::sync::{Arc, Mutex, OnceLock};
+
+// Compiled glob sets keyed by their source patterns. Matchers are consulted
+// once per file, so rebuilding the globset for every check dominates the
+// scan phase on large repositories; compiling each distinct pattern list
+// once makes repeat lookups a hash probe.
+//
+// The cache is LRU-bounded: include/exclude lists repeat across requests,
+// but gitignore pattern lists are effectively unique per repository, so an
+// unbounded map would grow by one compiled set per repository ever ingested
+// in a long-running batch or server process.
+const GLOB_SET_CACHE_SIZE: usize = 64;
+
+static GLOB_SET_CACHE: OnceLock<Mutex<LruCache<Vec<String>, Arc<GlobSet>>>> = OnceLock::new();
 
 pub struct PatternService;
 
@@ -68,17 +84,34 @@ impl PatternService {
         Ok(true)
     }
 
-    fn build_glob_set(patterns: &[String]) -> Result<GlobSet> {
+    fn build_glob_set(patterns: &[String]) -> Result<Arc<GlobSet>> {
+        let cache = GLOB_SET_CACHE.get_or_init(|| {
+            Mutex::new(LruCache::new(NonZeroUsize::new(GLOB_SET_CACHE_SIZE).unwrap()))
+        });
+        if let Some(glob_set) = cache.lock().unwrap().get(patterns) {
+            return Ok(glob_set.clone());
+        }
+
         let mut builder = GlobSetBuilder::new();
-        
+
         for pattern in patterns {
             let glob = Glob::new(pattern)
                 .map_err(|e| GitingestError::PatternError(format!("Invalid glob pattern '{}': {}", pattern, e)))?;
             builder.add(glob);
         }
 
-        builder.build()
-            .map_err(|e| GitingestError::PatternError(format!("Failed to build glob set: {}", e)))
+        let glob_set = Arc::new(builder.build()
+            .map_err(|e| GitingestError::PatternError(format!("Failed to build glob set: {}", e)))?);
+        cache.lock().unwrap().put(patterns.to_vec(), glob_set.clone());
+        Ok(glob_set)
+    }
+
+    /// Split a raw comma-separated pattern string into individual patterns.
+    pub fn split_patterns(raw: &str) -> Vec<String> {
+        raw.split(',')
+            .map(|p| p.trim().to_string())
+            .filter(|p| !p.is_empty())
+            .collect()
     }
 
     pub fn parse_gitignore<P: AsRef<Path>>(gitignore_path: P) -> Result<Vec<String>> {
@@ -169,6 +202,15 @@ mod tests {
         assert!(!PatternService::should_include_file(&matcher, "README.md").unwrap());
     }
 
+    #[test]
+    fn test_split_patterns() {
+        assert_eq!(
+            PatternService::split_patterns("*.rs, *.toml ,,"),
+            vec!["*.rs".to_string(), "*.toml".to_string()]
+        );
+        assert!(PatternService::split_patterns("").is_empty());
+    }
+
     #[test]
     fn test_binary_file_detection() {
         assert!(is_binary_file("test.exe"));
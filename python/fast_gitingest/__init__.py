@@ -0,0 +1,194 @@
+"""Python bindings for the fast-gitingest Rust core."""
+
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from .gitingest_python import Gitingest, GitingestConfig, IngestOptions
+
+_default_gitingest: Optional[Gitingest] = None
+
+
+def _get_gitingest() -> Gitingest:
+    """Return the shared ``Gitingest`` instance, building it on first use.
+
+    The PyO3 constructor crosses the FFI boundary and re-reads the
+    environment; one instance is enough for every default-configured call.
+    """
+    global _default_gitingest
+    if _default_gitingest is None:
+        _default_gitingest = Gitingest()
+    return _default_gitingest
+
+
+async def ingest_repo(
+    url: str,
+    *,
+    include_patterns: Union[str, List[str], None] = None,
+    exclude_patterns: Union[str, List[str], None] = None,
+    max_file_size: Optional[int] = None,
+    max_files: Optional[int] = None,
+    branch: Optional[str] = None,
+    token: Optional[str] = None,
+    include_submodules: bool = False,
+) -> Dict[str, Any]:
+    """Ingest a Git repository and return the result as a dict.
+
+    The heavy lifting (clone, scan, content extraction) happens in the Rust
+    core; this coroutine resolves once the full result is available.  The
+    ``content`` field is ``bytes`` (UTF-8) so the often multi-megabyte
+    payload crosses the FFI boundary without a string conversion; decode it
+    if you need ``str``.
+    """
+    options = IngestOptions(
+        include_patterns=include_patterns,
+        exclude_patterns=exclude_patterns,
+        max_file_size=max_file_size,
+        max_files=max_files,
+        branch=branch,
+        token=token,
+        include_submodules=include_submodules,
+    )
+    return await _get_gitingest().ingest(url, options)
+
+
+async def ingest_many(
+    urls: List[str],
+    *,
+    max_concurrency: int = 8,
+    include_patterns: Union[str, List[str], None] = None,
+    exclude_patterns: Union[str, List[str], None] = None,
+    max_file_size: Optional[int] = None,
+    max_files: Optional[int] = None,
+    token: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Ingest several repositories concurrently.
+
+    The whole batch is driven inside the Rust core on one Tokio runtime, so
+    Python is only re-entered once with the collected results.  Failed
+    repositories come back as ``{"status": "failed", ...}`` entries rather
+    than aborting the batch.
+    """
+    options = IngestOptions(
+        include_patterns=include_patterns,
+        exclude_patterns=exclude_patterns,
+        max_file_size=max_file_size,
+        max_files=max_files,
+        token=token,
+    )
+    return await _get_gitingest().ingest_many(
+        urls, options, max_concurrency=max_concurrency
+    )
+
+
+async def ingest_repo_stream(
+    url: str,
+    *,
+    include_patterns: Union[str, List[str], None] = None,
+    exclude_patterns: Union[str, List[str], None] = None,
+    max_file_size: Optional[int] = None,
+    max_files: Optional[int] = None,
+    branch: Optional[str] = None,
+    token: Optional[str] = None,
+    include_submodules: bool = False,
+    buffer: int = 16,
+) -> AsyncIterator[Tuple[str, bytes]]:
+    """Stream an ingest as ``(label, bytes)`` pairs.
+
+    Yields ``("repository", ...)``, ``("summary", ...)`` and
+    ``("tree", ...)`` first, then one ``(relative_path, content block)``
+    pair per file in tree order.  Memory stays bounded by ``buffer`` blocks
+    no matter how large the repository is.
+    """
+    options = IngestOptions(
+        include_patterns=include_patterns,
+        exclude_patterns=exclude_patterns,
+        max_file_size=max_file_size,
+        max_files=max_files,
+        branch=branch,
+        token=token,
+        include_submodules=include_submodules,
+    )
+    stream = _get_gitingest().ingest_stream(url, options, buffer=buffer)
+    async for item in stream:
+        yield item
+
+
+def ingest_repo_sync(
+    url: str,
+    *,
+    include_patterns: Union[str, List[str], None] = None,
+    exclude_patterns: Union[str, List[str], None] = None,
+    max_file_size: Optional[int] = None,
+    max_files: Optional[int] = None,
+    branch: Optional[str] = None,
+    token: Optional[str] = None,
+    include_submodules: bool = False,
+) -> Dict[str, Any]:
+    """Synchronous version of :func:`ingest_repo`.
+
+    Calls straight into the Rust core with the GIL released, so threads
+    (e.g. a ``ThreadPoolExecutor`` ingesting many repositories) run in
+    parallel; no event loop is involved.
+    """
+    options = IngestOptions(
+        include_patterns=include_patterns,
+        exclude_patterns=exclude_patterns,
+        max_file_size=max_file_size,
+        max_files=max_files,
+        branch=branch,
+        token=token,
+        include_submodules=include_submodules,
+    )
+    return _get_gitingest().ingest_sync(url, options)
+
+
+def ingest_many_sync(
+    urls: List[str],
+    *,
+    max_concurrency: int = 8,
+    include_patterns: Union[str, List[str], None] = None,
+    exclude_patterns: Union[str, List[str], None] = None,
+    max_file_size: Optional[int] = None,
+    max_files: Optional[int] = None,
+    token: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Synchronous version of :func:`ingest_many`; releases the GIL."""
+    options = IngestOptions(
+        include_patterns=include_patterns,
+        exclude_patterns=exclude_patterns,
+        max_file_size=max_file_size,
+        max_files=max_files,
+        token=token,
+    )
+    return _get_gitingest().ingest_many_sync(
+        urls, options, max_concurrency=max_concurrency
+    )
+
+
+def close() -> None:
+    """Release the cached ``Gitingest`` instance."""
+    global _default_gitingest
+    _default_gitingest = None
+
+
+def __getattr__(name: str):
+    # PEP 562: resolve the CLI entry point lazily so `import fast_gitingest`
+    # does not pay for argparse and the rest of the CLI module.
+    if name == "main":
+        from .main import main
+
+        globals()["main"] = main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = [
+    "Gitingest",
+    "GitingestConfig",
+    "IngestOptions",
+    "ingest_repo",
+    "ingest_repo_stream",
+    "ingest_repo_sync",
+    "ingest_many",
+    "ingest_many_sync",
+    "close",
+    "main",
+]
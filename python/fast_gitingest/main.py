@@ -0,0 +1,183 @@
+"""Command-line interface for fast-gitingest."""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # argparse is imported lazily at runtime (inside create_parser); the
+    # annotations below resolve via `from __future__ import annotations`.
+    import argparse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+from .gitingest_python import GitingestConfig, IngestOptions
+
+# Output templates, pre-built once at module level so batch invocations do
+# not re-scan format specs or rebuild the wrapper dicts per call.  The
+# header templates are applied with format_map on the result dict; content
+# bytes are appended as their own section.
+_MD_HEADER_TEMPLATE = (
+    "# Repository: {short_repo_url}\n\n"
+    "## Summary\n{summary}\n\n"
+    "## Directory Structure\n```\n{tree}\n```\n\n"
+    "## File Contents\n"
+)
+_TEXT_HEADER_TEMPLATE = (
+    "Repository: {short_repo_url}\n"
+    "Summary:\n{summary}\n\n"
+    "Directory Structure:\n{tree}\n\n"
+    "File Contents:\n"
+)
+
+
+def create_parser() -> argparse.ArgumentParser:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="fast-gitingest",
+        description="Fast Git repository ingestion and analysis tool",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    ingest = subparsers.add_parser("ingest", help="Ingest a Git repository")
+    ingest.add_argument("url", help="Git repository URL or path")
+    ingest.add_argument(
+        "-f",
+        "--format",
+        choices=["text", "markdown", "json"],
+        default="text",
+        help="Output format",
+    )
+    ingest.add_argument("-o", "--output", help="Output file path")
+    ingest.add_argument("--include", help="Include patterns (comma-separated)")
+    ingest.add_argument("--exclude", help="Exclude patterns (comma-separated)")
+    ingest.add_argument("--max-file-size", type=int, help="Maximum file size in bytes")
+    ingest.add_argument("--max-files", type=int, help="Maximum number of files")
+    ingest.add_argument("--branch", help="Branch to ingest")
+    ingest.add_argument("--token", help="Access token for private repositories")
+    ingest.add_argument(
+        "--include-submodules", action="store_true", help="Include git submodules"
+    )
+
+    subparsers.add_parser("platforms", help="List supported Git hosting platforms")
+    subparsers.add_parser("config", help="Show the effective configuration")
+
+    return parser
+
+
+async def handle_ingest(args: argparse.Namespace) -> None:
+    import json
+    import sys
+
+    from . import _get_gitingest
+
+    gitingest = _get_gitingest()
+
+    # One options object crosses the FFI boundary instead of seven kwargs.
+    # Raw pattern strings are split (and their globs compiled and cached)
+    # on the Rust side.
+    options = IngestOptions(
+        include_patterns=args.include or None,
+        exclude_patterns=args.exclude or None,
+        max_file_size=args.max_file_size,
+        max_files=args.max_files,
+        branch=args.branch,
+        token=args.token,
+        include_submodules=args.include_submodules,
+    )
+
+    if args.output:
+        # Format and write entirely on the Rust side: the content is spooled
+        # through a buffered file writer over there and never materialized as
+        # a Python object at all.
+        await gitingest.ingest_to_file(args.url, args.output, options, format=args.format)
+        print(f"Output written to: {args.output}")
+        return
+
+    result = await gitingest.ingest(args.url, options)
+
+    if args.format == "json":
+        # Pretty-print for an interactive terminal; piped output skips both
+        # the indent work and the extra whitespace bytes.
+        indent = 2 if sys.stdout.isatty() else None
+        payload = {**result, "content": result["content"].decode("utf-8", "replace")}
+        if orjson is not None:
+            sections = (
+                orjson.dumps(payload, option=orjson.OPT_INDENT_2 if indent else 0),
+            )
+        else:
+            sections = (json.dumps(payload, indent=indent),)
+    elif args.format == "markdown":
+        sections = (_MD_HEADER_TEMPLATE.format_map(result), result["content"])
+    else:
+        sections = (_TEXT_HEADER_TEMPLATE.format_map(result), result["content"])
+
+    # Emit through the binary stdout buffer so already-encoded sections are
+    # not round-tripped through str.
+    out = sys.stdout.buffer
+    for section in sections:
+        if isinstance(section, str):
+            section = section.encode("utf-8")
+        out.write(section)
+    out.write(b"\n")
+    out.flush()
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_config() -> GitingestConfig:
+    # from_env crosses the FFI boundary and walks the environment; the
+    # result cannot change within a process, so fetch it once.
+    return GitingestConfig.from_env()
+
+
+def handle_platforms() -> None:
+    config = _cached_config()
+    print("Supported platforms:")
+    for host in config.allowed_hosts:
+        print(f"  - {host}")
+
+
+def handle_config() -> None:
+    config = _cached_config()
+    print("Configuration:")
+    print(f"  max_file_size: {config.max_file_size}")
+    print(f"  max_files: {config.max_files}")
+    print(f"  max_total_size: {config.max_total_size}")
+    print(f"  max_directory_depth: {config.max_directory_depth}")
+    print(f"  default_timeout: {config.default_timeout}")
+    print(f"  concurrent_file_limit: {config.concurrent_file_limit}")
+    print(f"  batch_size: {config.batch_size}")
+    print(f"  allowed_hosts: {', '.join(config.allowed_hosts)}")
+
+
+def main() -> None:
+    import asyncio
+
+    parser = create_parser()
+    args = parser.parse_args()
+
+    # Only ingest needs an event loop; platforms/config/help are plain
+    # prints and skip asyncio setup entirely.
+    if args.command == "ingest":
+        try:
+            import uvloop
+
+            uvloop.install()
+        except ImportError:  # pragma: no cover - optional accelerator
+            pass
+        asyncio.run(handle_ingest(args))
+    elif args.command == "platforms":
+        handle_platforms()
+    elif args.command == "config":
+        handle_config()
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
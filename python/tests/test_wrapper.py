@@ -0,0 +1,40 @@
+import pytest
+
+pytest.importorskip(
+    "fast_gitingest.gitingest_python", reason="compiled extension not built"
+)
+
+import fast_gitingest  # noqa: E402
+from fast_gitingest.main import create_parser  # noqa: E402
+
+
+def test_parser_ingest_defaults():
+    args = create_parser().parse_args(["ingest", "https://github.com/owner/repo"])
+    assert args.command == "ingest"
+    assert args.format == "text"
+    assert args.output is None
+    assert args.include is None
+
+
+def test_default_gitingest_is_reused():
+    first = fast_gitingest._get_gitingest()
+    second = fast_gitingest._get_gitingest()
+    assert first is second
+    fast_gitingest.close()
+    assert fast_gitingest._get_gitingest() is not first
+    fast_gitingest.close()
+
+
+def test_ingest_options_normalizes_patterns():
+    options = fast_gitingest.IngestOptions(include_patterns="*.py, *.rs")
+    assert options.include_patterns == ["*.py", "*.rs"]
+    options.exclude_patterns = ["target/"]
+    assert options.exclude_patterns == ["target/"]
+    assert options.include_submodules is False
+
+
+def test_sync_entry_points_exist():
+    gitingest = fast_gitingest._get_gitingest()
+    assert callable(gitingest.ingest_sync)
+    assert callable(gitingest.ingest_many_sync)
+    fast_gitingest.close()